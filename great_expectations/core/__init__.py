@@ -574,13 +574,23 @@ class ExpectationSuite(object):
             return citations
         return self._sort_citations(citations)
 
+    @staticmethod
+    def is_table_expectation(expectation):
+        """Return True if the expectation configuration is a table expectation."""
+        return expectation.expectation_type.startswith("expect_table_")
+
+    @staticmethod
+    def is_column_expectation(expectation):
+        """Return True if the expectation configuration is a column expectation."""
+        return "column" in expectation.kwargs
+
     def get_table_expectations(self):
         """Return a list of table expectations."""
-        return [e for e in self.expectations if e.expectation_type.startswith("expect_table_")]
+        return [e for e in self.expectations if self.is_table_expectation(e)]
 
     def get_column_expectations(self):
         """Return a list of column map expectations."""
-        return [e for e in self.expectations if "column" in e.kwargs]
+        return [e for e in self.expectations if self.is_column_expectation(e)]
 
     @staticmethod
     def _filter_citations(citations, filter_key):
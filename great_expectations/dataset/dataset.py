@@ -229,6 +229,27 @@ class Dataset(MetaDataset):
         """Returns: int"""
         raise NotImplementedError
 
+    def get_column_unique_and_nonnull_counts(self, columns, allow_relative_error=False):
+        """Get the unique and nonnull value counts of several columns at once.
+
+        Backends that can compute the counts for every column in a single pass over the data should override this.
+
+        Args:
+            columns (list of str): names of the columns to count
+            allow_relative_error (boolean or float): False for exact unique counts, or the maximum relative \
+            standard deviation allowed when approximating them. Backends that cannot approximate unique counts \
+            raise a ValueError when this is not False.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: (unique_count, nonnull_count) for each column
+        """
+        if allow_relative_error is not False:
+            raise ValueError("%s does not support approximate unique counts." % self.__class__.__name__)
+        return {
+            column: (self.get_column_unique_count(column), self.get_column_nonnull_count(column))
+            for column in columns
+        }
+
     def get_column_modes(self, column):
         """Returns: List[any], list of modes (ties OK)"""
         raise NotImplementedError
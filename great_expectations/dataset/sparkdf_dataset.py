@@ -26,6 +26,7 @@ try:
         year,
         count,
         countDistinct,
+        approx_count_distinct,
         monotonically_increasing_id
     )
     import pyspark.sql.types as sparktypes
@@ -427,6 +428,25 @@ class SparkDFDataset(MetaSparkDFDataset):
     def get_column_unique_count(self, column):
         return self.spark_df.agg(countDistinct(column)).collect()[0][0]
 
+    def get_column_unique_and_nonnull_counts(self, columns, allow_relative_error=False):
+        if allow_relative_error is not False and (
+                not isinstance(allow_relative_error, float) or allow_relative_error <= 0 or allow_relative_error >= 1):
+            raise ValueError("SparkDFDataset requires relative error to be False or to be a float between 0 and 1.")
+        aggregates = []
+        for column in columns:
+            if allow_relative_error:
+                aggregates.append(approx_count_distinct(col(column), rsd=allow_relative_error))
+            else:
+                aggregates.append(countDistinct(col(column)))
+            aggregates.append(count(col(column)))
+        if not aggregates:
+            return {}
+        counts = self.spark_df.agg(*aggregates).collect()[0]
+        return {
+            column: (counts[2 * idx], counts[2 * idx + 1])
+            for idx, column in enumerate(columns)
+        }
+
     def get_column_modes(self, column):
         """leverages computation done in _get_column_value_counts"""
         s = self.get_column_value_counts(column)
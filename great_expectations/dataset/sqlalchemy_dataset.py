@@ -309,6 +309,12 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             raise ValueError("No snowflake_transient_table specified. Snowflake with a query batch_kwarg will create "
                              "a transient table, so you must provide a user-selected name.")
 
+        # temporary tables are only visible to the connection that created them; bigquery and snowflake create
+        # permanent and transient tables instead
+        self.has_temporary_table = (
+            bool(custom_sql) and self.engine.dialect.name.lower() not in ["bigquery", "snowflake"]
+        )
+
         if custom_sql:
             self.create_temporary_table(table_name, custom_sql, schema_name=schema)
 
@@ -465,6 +471,21 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 self._table)
         ).scalar()
 
+    def get_column_unique_and_nonnull_counts(self, columns, allow_relative_error=False):
+        if allow_relative_error is not False:
+            raise ValueError("SqlAlchemyDataset does not support approximate unique counts.")
+        selects = []
+        for column in columns:
+            selects.append(sa.func.count(sa.func.distinct(sa.column(column))))
+            selects.append(sa.func.count(sa.column(column)))
+        if not selects:
+            return {}
+        counts = self.engine.execute(sa.select(selects).select_from(self._table)).fetchone()
+        return {
+            column: (int(counts[2 * idx] or 0), int(counts[2 * idx + 1] or 0))
+            for idx, column in enumerate(columns)
+        }
+
     def get_column_median(self, column):
         nonnull_count = self.get_column_nonnull_count(column)
         element_values = self.engine.execute(
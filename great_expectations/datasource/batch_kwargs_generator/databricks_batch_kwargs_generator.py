@@ -1,6 +1,8 @@
 import logging
+import time
 
 from great_expectations.datasource.batch_kwargs_generator.batch_kwargs_generator import BatchKwargsGenerator
+from great_expectations.datasource.types import SparkDFDatasourceTableBatchKwargs
 
 logger = logging.getLogger(__name__)
 
@@ -16,31 +18,58 @@ class DatabricksTableBatchKwargsGenerator(BatchKwargsGenerator):
 
     def __init__(self, name="default",
                  datasource=None,
-                 database="default"):
+                 database="default",
+                 cache_ttl=60):
         super(DatabricksTableBatchKwargsGenerator, self).__init__(name, datasource=datasource)
         self.database = database
-        try:
-            self.spark = SparkSession.builder.getOrCreate()
-        except Exception:
-            logger.error("Unable to load spark context; install optional spark dependency for support.")
-            self.spark = None
+        # table names from "show tables" are reused for cache_ttl seconds so repeated listings do not rerun the query
+        self.cache_ttl = cache_ttl
+        self._tables_cache = None
+        self._tables_cache_time = None
+        # the spark session is created on first use, so that building the generator from config does not start a JVM
+        self._spark = None
 
-    def get_available_data_asset_names(self):
+    @property
+    def spark(self):
+        if self._spark is None:
+            try:
+                self._spark = SparkSession.builder.getOrCreate()
+            except Exception:
+                logger.error("Unable to load spark context; install optional spark dependency for support.")
+                # remember the failure so that we do not retry on every access
+                self._spark = False
+        return self._spark or None
+
+    def get_available_data_asset_names(self, limit=None):
         if self.spark is None:
             logger.warning("No sparkSession available to query for tables.")
             return {"names": []}
 
-        tables = self.spark.sql('show tables in {}'.format(self.database))
-        return {"names": [(row.tableName, "table") for row in tables.collect()]}
+        if self._tables_cache is not None and time.time() - self._tables_cache_time > self.cache_ttl:
+            self.invalidate_asset_cache()
+
+        if limit is not None:
+            if self._tables_cache is not None:
+                return {"names": [(table_name, "table") for table_name in self._tables_cache[:limit]]}
+            tables = self.spark.sql('show tables in {}'.format(self.database))
+            return {"names": [(row.tableName, "table") for row in tables.limit(limit).take(limit)]}
+
+        if self._tables_cache is None:
+            tables = self.spark.sql('show tables in {}'.format(self.database))
+            self._tables_cache = [row.tableName for row in tables.toLocalIterator()]
+            self._tables_cache_time = time.time()
+        return {"names": [(table_name, "table") for table_name in self._tables_cache]}
+
+    def invalidate_asset_cache(self):
+        """Drop the cached table list so the next call to get_available_data_asset_names queries spark again."""
+        self._tables_cache = None
+        self._tables_cache_time = None
 
     def _get_iterator(self, generator_asset, **kwargs):
-        query = 'select * from {}.{}'.format(self.database, generator_asset)
+        batch_kwargs = SparkDFDatasourceTableBatchKwargs(table='{}.{}'.format(self.database, generator_asset))
         if kwargs.get('partition'):
             if not kwargs.get('date_field'):
                 raise Exception('Must specify date_field when using partition.')
-            query += ' where {} = "{}"'.format(kwargs.get('date_field'), kwargs.get('partition'))
-        return iter([
-            {
-                "query": query
-            }
-        ])
+            batch_kwargs["date_field"] = kwargs.get('date_field')
+            batch_kwargs["partition"] = kwargs.get('partition')
+        return iter([batch_kwargs])
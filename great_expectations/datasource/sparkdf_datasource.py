@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 try:
     from pyspark.sql import SparkSession, DataFrame
+    from pyspark.sql.functions import col, lit
 except ImportError:
     SparkSession = None
     # TODO: review logging more detail here
@@ -29,6 +30,7 @@ class SparkDFDatasource(Datasource):
         - PathBatchKwargs ("path" or "s3" keys)
         - InMemoryBatchKwargs ("dataset" key)
         - QueryBatchKwargs ("query" key)
+        - TableBatchKwargs ("table" key, optionally filtered to one "partition" of a "date_field")
     """
     recognized_batch_parameters = {'reader_method', 'reader_options', 'limit', 'dataset_options'}
 
@@ -149,6 +151,14 @@ class SparkDFDatasource(Datasource):
         elif "query" in batch_kwargs:
             df = self.spark.sql(batch_kwargs["query"])
 
+        elif "table" in batch_kwargs:
+            df = self.spark.table(batch_kwargs["table"])
+            if batch_kwargs.get("partition"):
+                if not batch_kwargs.get("date_field"):
+                    raise BatchKwargsError("Must specify date_field when using partition.", batch_kwargs)
+                # filtering the DataFrame lets spark prune partitions without interpolating the value into SQL
+                df = df.where(col(batch_kwargs["date_field"]) == lit(batch_kwargs["partition"]))
+
         elif "dataset" in batch_kwargs and isinstance(batch_kwargs["dataset"], (DataFrame, SparkDFDataset)):
             df = batch_kwargs.get("dataset")
             # We don't want to store the actual dataframe in kwargs; copy the remaining batch_kwargs
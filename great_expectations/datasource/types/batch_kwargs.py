@@ -136,6 +136,25 @@ class SqlAlchemyDatasourceQueryBatchKwargs(SqlAlchemyDatasourceBatchKwargs):
         return self.get("query_parameters")
 
 
+class SparkDFDatasourceTableBatchKwargs(SparkDFDatasourceBatchKwargs):
+    def __init__(self, *args, **kwargs):
+        super(SparkDFDatasourceTableBatchKwargs, self).__init__(*args, **kwargs)
+        if "table" not in self:
+            raise InvalidBatchKwargsError("SparkDFDatasourceTableBatchKwargs requires a 'table' element")
+
+    @property
+    def table(self):
+        return self.get("table")
+
+    @property
+    def date_field(self):
+        return self.get("date_field")
+
+    @property
+    def partition(self):
+        return self.get("partition")
+
+
 class SparkDFDatasourceQueryBatchKwargs(SparkDFDatasourceBatchKwargs):
     def __init__(self, *args, **kwargs):
         super(SparkDFDatasourceQueryBatchKwargs, self).__init__(*args, **kwargs)
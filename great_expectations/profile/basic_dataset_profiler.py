@@ -70,6 +70,14 @@ class BasicDatasetProfilerBase(DatasetProfiler):
         except KeyError:  # if observed_value value is not set
             logger.error("Failed to get cardinality of column {0:s} - continuing...".format(column))
 
+        cardinality = cls._get_cardinality_from_counts(num_unique, pct_unique)
+
+        df.set_config_value('interactive_evaluation', False)
+
+        return cardinality
+
+    @classmethod
+    def _get_cardinality_from_counts(cls, num_unique, pct_unique):
         if num_unique is None or num_unique == 0 or pct_unique is None:
             cardinality = ProfilerCardinality.NONE
         elif pct_unique == 1.0:
@@ -90,8 +98,6 @@ class BasicDatasetProfilerBase(DatasetProfiler):
             else:
                 cardinality = ProfilerCardinality.MANY
 
-        df.set_config_value('interactive_evaluation', False)
-
         return cardinality
 
 
@@ -1,8 +1,15 @@
 import datetime
+import math
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from dateutil.parser import parse
 
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
 from great_expectations.dataset.util import build_categorical_partition_object
 from great_expectations.exceptions import ProfilerError
 from great_expectations.profile.base import (
@@ -14,6 +21,8 @@ from great_expectations.profile.basic_dataset_profiler import (
     logger,
 )
 
+NUMERIC_COLUMN_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
 
 class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
     """
@@ -87,8 +96,17 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
     expectations glossary documentation page, but on a users' own data.
 
     suite, validation_result = BasicSuiteBuilderProfiler().profile(dataset, configuration="demo")
+
+    Setting `parallel_profiling` to True in the configuration computes the
+    column statistics the expectations need concurrently before the
+    expectations are built, which helps on wide tables in SQL or Spark
+    backends. It has no effect on datasets that do not cache metrics, that
+    use a single connection, or that read from a temporary table.
     """
 
+    PARALLEL_PROFILING_MAX_WORKERS = 8
+    CARDINALITY_RELATIVE_ERROR = 0.05
+
     @classmethod
     def _get_column_type_with_caching(cls, dataset, column_name, cache):
         column_cache_entry = cache.get(column_name)
@@ -128,6 +146,64 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
 
         return column_cardinality
 
+    @classmethod
+    def _prime_column_cache(cls, dataset, columns, column_cache):
+        """Compute the cardinality of all columns with a single query and store it in the column cache."""
+        columns = [column for column in columns if column not in column_cache]
+        if not columns:
+            return column_cache
+        try:
+            counts = cls._get_column_unique_and_nonnull_counts(dataset, columns)
+        except Exception as e:
+            # columns will fall back to being profiled one at a time
+            logger.debug(f"Unable to compute column cardinalities in bulk: {e}")
+            return column_cache
+
+        for column, (unique_count, nonnull_count) in counts.items():
+            pct_unique = float(unique_count) / nonnull_count if nonnull_count else None
+            column_cache[column] = {
+                "cardinality": cls._get_cardinality_from_counts(
+                    unique_count, pct_unique
+                ),
+                "unique_count": unique_count,
+                "nonnull_count": nonnull_count,
+            }
+        return column_cache
+
+    @classmethod
+    def _get_column_unique_and_nonnull_counts(cls, dataset, columns):
+        """Count unique values approximately where the backend supports it, and exactly where it matters.
+
+        An approximate unique count is only kept when no count within the error bounds would fall in a different
+        cardinality bucket; in particular, UNIQUE is always confirmed with an exact count.
+        """
+        relative_error = cls.CARDINALITY_RELATIVE_ERROR
+        try:
+            counts = dataset.get_column_unique_and_nonnull_counts(
+                columns, allow_relative_error=relative_error
+            )
+        except ValueError:
+            return dataset.get_column_unique_and_nonnull_counts(columns)
+
+        ambiguous_columns = []
+        for column, (unique_count, nonnull_count) in counts.items():
+            if not nonnull_count:
+                continue
+            # three standard deviations either side of the estimate
+            low = max(0, int(unique_count * (1 - 3 * relative_error)))
+            high = min(
+                nonnull_count, int(math.ceil(unique_count * (1 + 3 * relative_error)))
+            )
+            if cls._get_cardinality_from_counts(
+                low, float(low) / nonnull_count
+            ) != cls._get_cardinality_from_counts(high, float(high) / nonnull_count):
+                ambiguous_columns.append(column)
+        if ambiguous_columns:
+            counts.update(
+                dataset.get_column_unique_and_nonnull_counts(ambiguous_columns)
+            )
+        return counts
+
     @classmethod
     def _create_expectations_for_low_card_column(cls, dataset, column, column_cache):
         cls._create_non_nullity_expectations(dataset, column)
@@ -135,9 +211,13 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         value_set = dataset.expect_column_distinct_values_to_be_in_set(
             column, value_set=None, result_format="SUMMARY"
         ).result["observed_value"]
+        # the observed distinct values satisfy the expectation by construction, so
+        # register it without evaluating it a second time
+        dataset.set_config_value("interactive_evaluation", False)
         dataset.expect_column_distinct_values_to_be_in_set(
             column, value_set=value_set, result_format="SUMMARY"
         )
+        dataset.set_config_value("interactive_evaluation", True)
 
         if cls._get_column_cardinality_with_caching(dataset, column, column_cache) in [
             ProfilerCardinality.TWO,
@@ -163,91 +243,124 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
     def _create_expectations_for_numeric_column(cls, dataset, column):
         cls._create_non_nullity_expectations(dataset, column)
 
-        observed_min = dataset.expect_column_min_to_be_between(
-            column, min_value=None, max_value=None, result_format="SUMMARY"
-        ).result["observed_value"]
-        if not _is_nan(observed_min):
-            dataset.expect_column_min_to_be_between(
-                column, min_value=observed_min - 1, max_value=observed_min + 1
-            )
-        else:
-            logger.debug(
-                f"Skipping expect_column_min_to_be_between because observed value is nan: {observed_min}"
-            )
-
-        observed_max = dataset.expect_column_max_to_be_between(
-            column, min_value=None, max_value=None, result_format="SUMMARY"
-        ).result["observed_value"]
-        if not _is_nan(observed_max):
-            dataset.expect_column_max_to_be_between(
-                column, min_value=observed_max - 1, max_value=observed_max + 1
-            )
-        else:
-            logger.debug(
-                f"Skipping expect_column_max_to_be_between because observed value is nan: {observed_max}"
-            )
-
-        observed_mean = dataset.expect_column_mean_to_be_between(
-            column, min_value=None, max_value=None, result_format="SUMMARY"
-        ).result["observed_value"]
-        if not _is_nan(observed_mean):
-            dataset.expect_column_mean_to_be_between(
-                column, min_value=observed_mean - 1, max_value=observed_mean + 1
-            )
-        else:
-            logger.debug(
-                f"Skipping expect_column_mean_to_be_between because observed value is nan: {observed_mean}"
-            )
+        stats = cls._collect_numeric_stats(dataset, column)
+        dataset.set_config_value("interactive_evaluation", False)
+        for stat in ["min", "max", "mean", "median"]:
+            expectation_type = f"expect_column_{stat}_to_be_between"
+            observed_value = stats[stat]
+            if not _is_nan(observed_value):
+                getattr(dataset, expectation_type)(
+                    column, min_value=observed_value - 1, max_value=observed_value + 1
+                )
+            else:
+                logger.debug(
+                    f"Skipping {expectation_type} because observed value is nan: {observed_value}"
+                )
+        dataset.set_config_value("interactive_evaluation", True)
 
-        observed_median = dataset.expect_column_median_to_be_between(
-            column, min_value=None, max_value=None, result_format="SUMMARY"
-        ).result["observed_value"]
-        if not _is_nan(observed_median):
-            dataset.expect_column_median_to_be_between(
-                column, min_value=observed_median - 1, max_value=observed_median + 1
-            )
-        else:
-            logger.debug(
-                f"Skipping expect_column_median_to_be_between because observed value is nan: {observed_median}"
+        # get_column_quantiles computes all quantiles in a single query, and is called
+        # with the same arguments as the expectation so validation can reuse the result
+        try:
+            quantile_values = dataset.get_column_quantiles(
+                column, NUMERIC_COLUMN_QUANTILES, allow_relative_error=False
             )
-
-        quantile_result = dataset.expect_column_quantile_values_to_be_between(
-            column,
-            quantile_ranges={
-                "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
-                "value_ranges": [
-                    [None, None],
-                    [None, None],
-                    [None, None],
-                    [None, None],
-                    [None, None],
-                ],
-            },
-            result_format="SUMMARY",
-            catch_exceptions=True,
-        )
-        if quantile_result.exception_info and (
-            quantile_result.exception_info["exception_traceback"]
-            or quantile_result.exception_info["exception_message"]
-        ):
+        except Exception as e:
             # TODO quantiles are not implemented correctly on sqlite, and likely other sql dialects
-            logger.debug(quantile_result.exception_info["exception_traceback"])
-            logger.debug(quantile_result.exception_info["exception_message"])
+            logger.debug(f"Unable to compute quantiles for column {column}: {e}")
         else:
             dataset.set_config_value("interactive_evaluation", False)
             dataset.expect_column_quantile_values_to_be_between(
                 column,
                 quantile_ranges={
-                    "quantiles": quantile_result.result["observed_value"]["quantiles"],
-                    "value_ranges": [
-                        [v - 1, v + 1]
-                        for v in quantile_result.result["observed_value"]["values"]
-                    ],
+                    "quantiles": list(NUMERIC_COLUMN_QUANTILES),
+                    "value_ranges": [[v - 1, v + 1] for v in quantile_values],
                 },
                 catch_exceptions=True,
             )
             dataset.set_config_value("interactive_evaluation", True)
 
+    @classmethod
+    def _collect_numeric_stats(cls, dataset, column):
+        """Observe the summary statistics of a numeric column.
+
+        The values are read through the dataset's cached metric getters, using the same arguments as the
+        corresponding expectations, so validating the resulting suite does not need to compute them again.
+        """
+        return {
+            "min": dataset.get_column_min(column, False),
+            "max": dataset.get_column_max(column, False),
+            "mean": dataset.get_column_mean(column),
+            "median": dataset.get_column_median(column),
+        }
+
+    @classmethod
+    def _get_prefetch_skip_reason(cls, dataset):
+        """Return why metrics cannot be prefetched from several threads for this dataset, or None if they can."""
+        if not dataset.caching:
+            return "the dataset does not cache metrics"
+        engine = getattr(dataset, "engine", None)
+        if sa is not None and isinstance(engine, sa.engine.Connection):
+            return "the dataset uses a single connection, which cannot be shared between threads"
+        if getattr(dataset, "has_temporary_table", False):
+            return "the dataset's temporary table is only visible to the connection that created it"
+        if (
+            sa is not None
+            and isinstance(engine, sa.engine.Engine)
+            and engine.dialect.name.lower() == "sqlite"
+            and engine.url.database in [None, "", ":memory:"]
+        ):
+            return "each thread would open its own in-memory sqlite database"
+        return None
+
+    @classmethod
+    def _prefetch_column_metrics(cls, dataset, columns, column_cache):
+        """Compute the cached metrics the expectation builders will ask for, for several columns concurrently.
+
+        Expectations are still added to the dataset one column at a time since the dataset is not safe to
+        mutate from several threads; their queries are then answered from the dataset's metric cache.
+        """
+        skip_reason = cls._get_prefetch_skip_reason(dataset)
+        if skip_reason is not None:
+            logger.info(
+                f"Profiling columns serially because {skip_reason}; ignoring parallel_profiling."
+            )
+            return
+
+        def prefetch(column):
+            cardinality = column_cache[column].get("cardinality")
+            column_type = column_cache[column].get("type")
+            try:
+                if cardinality in [
+                    ProfilerCardinality.TWO,
+                    ProfilerCardinality.VERY_FEW,
+                    ProfilerCardinality.FEW,
+                ]:
+                    # the distinct value expectations call get_column_value_counts(column) while
+                    # build_categorical_partition_object passes sort positionally; each is its own cache key
+                    dataset.get_column_value_counts(column)
+                    dataset.get_column_value_counts(column, "value")
+                elif cardinality in [
+                    ProfilerCardinality.MANY,
+                    ProfilerCardinality.VERY_MANY,
+                    ProfilerCardinality.UNIQUE,
+                ]:
+                    if column_type in [ProfilerDataType.INT, ProfilerDataType.FLOAT]:
+                        cls._collect_numeric_stats(dataset, column)
+                        dataset.get_column_quantiles(
+                            column, NUMERIC_COLUMN_QUANTILES, allow_relative_error=False
+                        )
+                    elif column_type in [ProfilerDataType.DATETIME]:
+                        dataset.get_column_min(column, False)
+                        dataset.get_column_max(column, False)
+            except Exception as e:
+                # the error will surface again when the expectations are built
+                logger.debug(f"Unable to prefetch metrics for column {column}: {e}")
+
+        with ThreadPoolExecutor(
+            max_workers=cls.PARALLEL_PROFILING_MAX_WORKERS
+        ) as executor:
+            list(executor.map(prefetch, columns))
+
     @classmethod
     def _create_expectations_for_string_column(cls, dataset, column):
         cls._create_non_nullity_expectations(dataset, column)
@@ -279,10 +392,8 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         for column in columns:
             if column in profiled_columns["numeric"]:
                 continue
-            if (
-                column.lower().strip() == "id"
-                or column.lower().strip().find("_id") > -1
-            ):
+            normalized_column = column.lower().strip()
+            if normalized_column == "id" or normalized_column.find("_id") > -1:
                 continue
 
             cardinality = cls._get_column_cardinality_with_caching(
@@ -345,34 +456,25 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
     def _create_expectations_for_datetime_column(cls, dataset, column):
         cls._create_non_nullity_expectations(dataset, column)
 
-        min_value = dataset.expect_column_min_to_be_between(
-            column, min_value=None, max_value=None, result_format="SUMMARY"
-        ).result["observed_value"]
-
+        # read the bounds directly rather than through expect_column_{min,max}_to_be_between,
+        # which would register expectations that then have to be removed again
+        min_value = dataset.get_column_min(column, False)
         if min_value is not None:
-            dataset.remove_expectation(
-                expectation_type="expect_column_min_to_be_between", column=column
-            )
             try:
                 min_value = min_value + datetime.timedelta(days=-365)
             except OverflowError:
                 min_value = datetime.datetime.min
             except TypeError:
-                min_value = parse(min_value) + datetime.timedelta(days=-365)
+                min_value = _parse_datetime(min_value) + datetime.timedelta(days=-365)
 
-        max_value = dataset.expect_column_max_to_be_between(
-            column, min_value=None, max_value=None, result_format="SUMMARY"
-        ).result["observed_value"]
+        max_value = dataset.get_column_max(column, False)
         if max_value is not None:
-            dataset.remove_expectation(
-                expectation_type="expect_column_max_to_be_between", column=column
-            )
             try:
                 max_value = max_value + datetime.timedelta(days=365)
             except OverflowError:
                 max_value = datetime.datetime.max
             except TypeError:
-                max_value = parse(max_value) + datetime.timedelta(days=365)
+                max_value = _parse_datetime(max_value) + datetime.timedelta(days=365)
 
         if min_value is not None or max_value is not None:
             dataset.expect_column_values_to_be_between(
@@ -389,8 +491,10 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         selected_columns = existing_columns
         included_expectations = []
         excluded_expectations = []
+        parallel_profiling = False
 
         if configuration:
+            parallel_profiling = configuration.get("parallel_profiling", False)
             if (
                 "included_expectations" in configuration
                 and "excluded_expectations" in configuration
@@ -418,13 +522,18 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
                 selected_columns = configuration["included_columns"]
             elif "excluded_columns" in configuration:
                 excluded_columns = configuration["excluded_columns"]
-                if excluded_columns in [False, None, []]:
-                    excluded_columns = []
-                selected_columns = set(existing_columns) - set(excluded_columns)
-
-        _check_that_columns_exist(dataset, selected_columns)
+                if excluded_columns not in [False, None, []]:
+                    # filter rather than take a set difference so columns keep table order
+                    excluded_columns = frozenset(excluded_columns)
+                    selected_columns = [
+                        column
+                        for column in existing_columns
+                        if column not in excluded_columns
+                    ]
+
+        _check_that_columns_exist(dataset, selected_columns, existing_columns)
         if included_expectations is None:
-            suite = cls._build_column_description_metadata(dataset)
+            suite = cls._build_column_description_metadata(dataset, existing_columns)
             # remove column exist expectations
             suite.expectations = []
             return suite
@@ -432,10 +541,18 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         dataset.set_default_expectation_argument("catch_exceptions", False)
         dataset = cls._build_table_row_count_expectation(dataset)
         dataset.set_config_value("interactive_evaluation", True)
-        dataset = cls._build_table_column_expectations(dataset)
+        dataset = cls._build_table_column_expectations(dataset, existing_columns)
 
         column_cache = {}
         if selected_columns:
+            cls._prime_column_cache(dataset, selected_columns, column_cache)
+            if parallel_profiling:
+                for column in selected_columns:
+                    cls._get_column_cardinality_with_caching(
+                        dataset, column, column_cache
+                    )
+                    cls._get_column_type_with_caching(dataset, column, column_cache)
+                cls._prefetch_column_metrics(dataset, selected_columns, column_cache)
             for column in selected_columns:
                 cardinality = cls._get_column_cardinality_with_caching(
                     dataset, column, column_cache
@@ -461,7 +578,14 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
                     #  expectations created here. The simple version is blacklisting
                     #  and the more complex version is desired per column type and
                     #  cardinality. This deserves more thought on configuration.
-                    dataset.expect_column_values_to_be_unique(column)
+                    if cardinality == ProfilerCardinality.UNIQUE:
+                        # every non-null value is distinct, so the expectation is
+                        # already known to pass and need not be evaluated here
+                        dataset.set_config_value("interactive_evaluation", False)
+                        dataset.expect_column_values_to_be_unique(column)
+                        dataset.set_config_value("interactive_evaluation", True)
+                    else:
+                        dataset.expect_column_values_to_be_unique(column)
 
                     if column_type in [ProfilerDataType.INT, ProfilerDataType.FLOAT]:
                         cls._create_expectations_for_numeric_column(dataset, column)
@@ -474,25 +598,17 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
                             f"Skipping expectation creation for column {column} of unknown type: {column_type}"
                         )
 
+        # filter the dataset's own suite; get_expectation_suite would return a deep copy
+        suite = dataset._expectation_suite
         if excluded_expectations:
-            dataset = _remove_table_expectations(dataset, excluded_expectations)
-            dataset = _remove_column_expectations(dataset, excluded_expectations)
+            suite = _remove_table_expectations(suite, excluded_expectations)
+            suite = _remove_column_expectations(suite, excluded_expectations)
         if included_expectations:
-            for expectation in dataset.get_expectation_suite().expectations:
-                if expectation.expectation_type not in included_expectations:
-                    try:
-                        dataset.remove_expectation(
-                            expectation_type=expectation.expectation_type,
-                            expectation_kwargs=expectation.kwargs,
-                            column=expectation.kwargs.get("column", None),
-                            remove_multiple_matches=True,
-                        )
-                    except ValueError:
-                        logger.debug(
-                            f"Attempted to remove {expectation}, which was not found."
-                        )
+            suite = _keep_expectations(suite, included_expectations)
 
-        expectation_suite = cls._build_column_description_metadata(dataset)
+        expectation_suite = cls._build_column_description_metadata(
+            dataset, existing_columns
+        )
 
         return expectation_suite
 
@@ -500,43 +616,49 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
     def _demo_profile(cls, dataset):
         dataset.set_default_expectation_argument("catch_exceptions", False)
         dataset = cls._build_table_row_count_expectation(dataset)
-        dataset.set_config_value("interactive_evaluation", True)
-        dataset = cls._build_table_column_expectations(dataset)
-
         columns = dataset.get_table_columns()
 
+        dataset.set_config_value("interactive_evaluation", True)
+        dataset = cls._build_table_column_expectations(dataset, columns)
+
         column_cache = {}
-        profiled_columns = {"numeric": [], "low_card": [], "string": [], "datetime": []}
+        cls._prime_column_cache(dataset, columns, column_cache)
+        profiled_columns = {
+            "numeric": set(),
+            "low_card": set(),
+            "string": set(),
+            "datetime": set(),
+        }
 
         column = cls._find_next_low_card_column(
             dataset, columns, profiled_columns, column_cache
         )
         if column:
             cls._create_expectations_for_low_card_column(dataset, column, column_cache)
-            profiled_columns["low_card"].append(column)
+            profiled_columns["low_card"].add(column)
 
         column = cls._find_next_numeric_column(
             dataset, columns, profiled_columns, column_cache
         )
         if column:
             cls._create_expectations_for_numeric_column(dataset, column)
-            profiled_columns["numeric"].append(column)
+            profiled_columns["numeric"].add(column)
 
         column = cls._find_next_string_column(
             dataset, columns, profiled_columns, column_cache
         )
         if column:
             cls._create_expectations_for_string_column(dataset, column)
-            profiled_columns["string"].append(column)
+            profiled_columns["string"].add(column)
 
         column = cls._find_next_datetime_column(
             dataset, columns, profiled_columns, column_cache
         )
         if column:
             cls._create_expectations_for_datetime_column(dataset, column)
-            profiled_columns["datetime"].append(column)
+            profiled_columns["datetime"].add(column)
 
-        expectation_suite = cls._build_column_description_metadata(dataset)
+        expectation_suite = cls._build_column_description_metadata(dataset, columns)
 
         expectation_suite.meta["notes"] = {
             "format": "markdown",
@@ -566,24 +688,25 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         return dataset
 
     @classmethod
-    def _build_table_column_expectations(cls, dataset):
-        columns = dataset.get_table_columns()
+    def _build_table_column_expectations(cls, dataset, columns=None):
+        if columns is None:
+            columns = dataset.get_table_columns()
         dataset.expect_table_column_count_to_equal(len(columns))
         dataset.expect_table_columns_to_match_ordered_list(columns)
         return dataset
 
     @classmethod
-    def _build_column_description_metadata(cls, dataset):
-        columns = dataset.get_table_columns()
+    def _build_column_description_metadata(cls, dataset, columns=None):
+        if columns is None:
+            columns = dataset.get_table_columns()
         expectation_suite = dataset.get_expectation_suite(
             suppress_warnings=True, discard_failed_expectations=False
         )
 
-        meta_columns = {}
-        for column in columns:
-            meta_columns[column] = {"description": ""}
+        meta_columns = {column: {"description": ""} for column in columns}
         if not expectation_suite.meta:
-            expectation_suite.meta = {"columns": meta_columns, "notes": {""}}
+            # notes are left to add_meta, which fills in the default markdown notes
+            expectation_suite.meta = {"columns": meta_columns}
         else:
             expectation_suite.meta["columns"] = meta_columns
 
@@ -592,53 +715,64 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
 
 def _check_that_expectations_are_available(dataset, expectations):
     if expectations:
+        available_expectations = frozenset(dataset.list_available_expectation_types())
         for expectation in expectations:
-            if expectation not in dataset.list_available_expectation_types():
+            if expectation not in available_expectations:
                 raise ProfilerError(f"Expectation {expectation} is not available.")
 
 
-def _check_that_columns_exist(dataset, columns):
+def _check_that_columns_exist(dataset, columns, existing_columns=None):
     if columns:
+        if existing_columns is None:
+            existing_columns = dataset.get_table_columns()
+        existing_columns = frozenset(existing_columns)
         for column in columns:
-            if column not in dataset.get_table_columns():
+            if column not in existing_columns:
                 raise ProfilerError(f"Column {column} does not exist.")
 
 
 def _is_nan(value):
+    if isinstance(value, float):
+        return math.isnan(value)
+    if isinstance(value, np.floating):
+        return bool(np.isnan(value))
+    return False
+
+
+def _parse_datetime(value):
     try:
-        return np.isnan(value)
-    except TypeError:
-        return False
-
-
-def _remove_table_expectations(dataset, all_types_to_remove):
-    suite = dataset.get_expectation_suite(discard_failed_expectations=False)
-    table_expectations = suite.get_table_expectations()
-    removals = [
-        e.expectation_type
-        for e in table_expectations
-        if e.expectation_type in all_types_to_remove
+        # fast path for the ISO 8601 strings SQL backends usually return
+        return datetime.datetime.fromisoformat(value)
+    except (AttributeError, ValueError):
+        # fromisoformat is unavailable before python 3.7
+        return parse(value)
+
+
+def _remove_table_expectations(suite, all_types_to_remove):
+    types_to_remove = frozenset(all_types_to_remove)
+    suite.expectations = [
+        e
+        for e in suite.expectations
+        if not (suite.is_table_expectation(e) and e.expectation_type in types_to_remove)
     ]
-    for expectation in removals:
-        try:
-            dataset.remove_expectation(expectation_type=expectation)
-        except ValueError:
-            pass
-    return dataset
+    return suite
 
 
-def _remove_column_expectations(dataset, all_types_to_remove):
-    suite = dataset.get_expectation_suite(discard_failed_expectations=False)
-    column_expectations = suite.get_column_expectations()
-    removals = [
-        e.expectation_type
-        for e in column_expectations
-        if e.expectation_type in all_types_to_remove
+def _remove_column_expectations(suite, all_types_to_remove):
+    types_to_remove = frozenset(all_types_to_remove)
+    suite.expectations = [
+        e
+        for e in suite.expectations
+        if not (
+            suite.is_column_expectation(e) and e.expectation_type in types_to_remove
+        )
     ]
-    for column in dataset.get_table_columns():
-        for exp in removals:
-            try:
-                dataset.remove_expectation(expectation_type=exp, column=column)
-            except ValueError:
-                pass
-    return dataset
+    return suite
+
+
+def _keep_expectations(suite, all_types_to_keep):
+    types_to_keep = frozenset(all_types_to_keep)
+    suite.expectations = [
+        e for e in suite.expectations if e.expectation_type in types_to_keep
+    ]
+    return suite
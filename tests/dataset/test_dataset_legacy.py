@@ -54,3 +54,42 @@ def test_head(test_backend):
     assert isinstance(head, PandasDataset)
     assert len(head) == 1
     assert list(head.columns) == ["a"]
+
+
+def test_get_column_unique_and_nonnull_counts(test_backend):
+    counts_data = OrderedDict([
+        ["a column", ["x", "y", "y", None]],
+        ["order", [1, 1, 2, 2]],
+        ["nulls", [None, None, None, None]],
+    ])
+    counts_schemas = {
+        "SparkDFDataset": {
+            "a column": "string",
+            "order": "int",
+            "nulls": "int",
+        },
+        "sqlite": {
+            "a column": "VARCHAR",
+            "order": "INTEGER",
+            "nulls": "INTEGER",
+        },
+        "postgresql": {
+            "a column": "TEXT",
+            "order": "INTEGER",
+            "nulls": "INTEGER",
+        },
+    }
+    dataset = get_dataset(test_backend, counts_data, schemas=counts_schemas.get(test_backend), caching=False)
+
+    counts = dataset.get_column_unique_and_nonnull_counts(["a column", "order", "nulls"])
+
+    # each count agrees with the single column metric it replaces
+    assert counts == {
+        "a column": (2, 3),
+        "order": (2, 4),
+        "nulls": (0, 0),
+    }
+    for column, (unique_count, nonnull_count) in counts.items():
+        assert unique_count == dataset.get_column_unique_count(column)
+        assert nonnull_count == dataset.get_column_nonnull_count(column)
+    assert dataset.get_column_unique_and_nonnull_counts([]) == {}
@@ -20,3 +20,16 @@ def test_sparkdfdataset_persist(spark_session):
     sdf.persist = mock.MagicMock()
     _ = SparkDFDataset(sdf)
     sdf.persist.assert_called_once()
+
+
+def test_sparkdfdataset_get_column_unique_and_nonnull_counts(spark_session):
+    df = pd.DataFrame({"a": ["x", "y", "y", None], "b": [1, 1, 1, 1]})
+    dataset = SparkDFDataset(spark_session.createDataFrame(df))
+
+    assert dataset.get_column_unique_and_nonnull_counts(["a", "b"]) == {
+        "a": (2, 3),
+        "b": (1, 4),
+    }
+    assert dataset.get_column_unique_and_nonnull_counts(
+        ["a", "b"], allow_relative_error=0.05
+    ) == {"a": (2, 3), "b": (1, 4)}
@@ -129,6 +129,7 @@ def test_sqlalchemydataset_with_custom_sql(sa):
 
     custom_sql = "SELECT name, pet FROM test_sql_data WHERE age > 12"
     custom_sql_dataset = SqlAlchemyDataset(engine=engine, custom_sql=custom_sql)
+    assert custom_sql_dataset.has_temporary_table
 
     custom_sql_dataset._initialize_expectations()
     custom_sql_dataset.set_default_expectation_argument(
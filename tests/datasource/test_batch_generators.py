@@ -164,4 +164,98 @@ def test_databricks_generator(basic_sparkdf_datasource):
 
     databricks_kwargs_iterator = generator.get_iterator("foo")
     kwargs = [batch_kwargs for batch_kwargs in databricks_kwargs_iterator]
-    assert "select * from" in kwargs[0]["query"].lower()
+    assert kwargs == [{"table": "default.foo"}]
+
+    generator.reset_iterator("foo", partition="2020-01-02", date_field="date")
+    kwargs = [
+        batch_kwargs for batch_kwargs in generator.get_iterator("foo", partition="2020-01-02", date_field="date")
+    ]
+    assert kwargs == [{"table": "default.foo", "date_field": "date", "partition": "2020-01-02"}]
+
+    with pytest.raises(Exception):
+        generator.reset_iterator("foo", partition="2020-01-02")
+
+
+def test_databricks_generator_batch_kwargs_are_stable_across_get_batch(basic_sparkdf_datasource):
+    basic_sparkdf_datasource.spark.createDataFrame(
+        [("2020-01-01", 1), ("2020-01-02", 2)], ["date", "value"]
+    ).createOrReplaceGlobalTempView("databricks_generator_test")
+    generator = DatabricksTableBatchKwargsGenerator(datasource=basic_sparkdf_datasource, database="global_temp")
+
+    generator.reset_iterator("databricks_generator_test", partition="2020-01-02", date_field="date")
+    batch_kwargs = generator.yield_batch_kwargs(
+        "databricks_generator_test", partition="2020-01-02", date_field="date"
+    )
+
+    batch = basic_sparkdf_datasource.get_batch(batch_kwargs)
+    assert [row.value for row in batch.data.collect()] == [2]
+    # the kwargs name the table and partition, so they can be stored and used to fetch the same batch again
+    assert batch.batch_kwargs["table"] == "global_temp.databricks_generator_test"
+    assert "SparkDFRef" not in batch.batch_kwargs
+    assert "ge_batch_id" not in batch.batch_kwargs
+
+    second_batch = basic_sparkdf_datasource.get_batch(batch.batch_kwargs)
+    assert second_batch.batch_kwargs.to_id() == batch.batch_kwargs.to_id()
+    assert [row.value for row in second_batch.data.collect()] == [2]
+
+
+def _mock_databricks_spark(table_names):
+    spark = mock.Mock()
+    spark.sql.return_value.toLocalIterator.side_effect = lambda: iter(
+        [mock.Mock(tableName=table_name) for table_name in table_names]
+    )
+    return spark
+
+
+def test_databricks_generator_caches_table_names():
+    generator = DatabricksTableBatchKwargsGenerator(datasource=mock.Mock())
+    generator._spark = _mock_databricks_spark(["foo", "bar"])
+
+    assert generator.get_available_data_asset_names() == {"names": [("foo", "table"), ("bar", "table")]}
+    assert generator.get_available_data_asset_names() == {"names": [("foo", "table"), ("bar", "table")]}
+    generator._spark.sql.assert_called_once_with("show tables in default")
+
+    generator.invalidate_asset_cache()
+    assert generator.get_available_data_asset_names() == {"names": [("foo", "table"), ("bar", "table")]}
+    assert generator._spark.sql.call_count == 2
+
+
+def test_databricks_generator_table_name_cache_expires():
+    generator = DatabricksTableBatchKwargsGenerator(datasource=mock.Mock(), cache_ttl=60)
+    generator._spark = _mock_databricks_spark(["foo"])
+
+    with mock.patch("time.time", return_value=1000.0):
+        generator.get_available_data_asset_names()
+    with mock.patch("time.time", return_value=1030.0):
+        generator.get_available_data_asset_names()
+    assert generator._spark.sql.call_count == 1
+
+    with mock.patch("time.time", return_value=1061.0):
+        assert generator.get_available_data_asset_names() == {"names": [("foo", "table")]}
+    assert generator._spark.sql.call_count == 2
+
+
+def test_databricks_generator_limited_listing():
+    generator = DatabricksTableBatchKwargsGenerator(datasource=mock.Mock())
+    spark = _mock_databricks_spark(["foo", "bar", "baz"])
+    spark.sql.return_value.limit.return_value.take.return_value = [mock.Mock(tableName="foo")]
+    generator._spark = spark
+
+    # cold: only the requested rows are fetched, and the partial result is not cached
+    assert generator.get_available_data_asset_names(limit=1) == {"names": [("foo", "table")]}
+    spark.sql.return_value.limit.assert_called_once_with(1)
+    spark.sql.return_value.limit.return_value.take.assert_called_once_with(1)
+    spark.sql.return_value.toLocalIterator.assert_not_called()
+    assert generator._tables_cache is None
+
+    # unlimited: the full listing is streamed to the driver and cached
+    assert generator.get_available_data_asset_names() == {
+        "names": [("foo", "table"), ("bar", "table"), ("baz", "table")]
+    }
+    spark.sql.return_value.toLocalIterator.assert_called_once_with()
+    assert spark.sql.call_count == 2
+
+    # warm: a limited call slices the cached listing without querying spark
+    assert generator.get_available_data_asset_names(limit=2) == {"names": [("foo", "table"), ("bar", "table")]}
+    assert spark.sql.call_count == 2
+    spark.sql.return_value.limit.assert_called_once_with(1)
@@ -1,7 +1,15 @@
+import datetime
 import json
+import logging
 import os
 from collections import OrderedDict
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import numpy as np
 import pytest
 from numpy import Infinity
 
@@ -10,14 +18,39 @@ from great_expectations.core import ExpectationSuite
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.datasource import PandasDatasource
 from great_expectations.exceptions import ProfilerError
+from great_expectations.profile.base import ProfilerCardinality
 from great_expectations.profile.basic_suite_builder_profiler import (
     BasicSuiteBuilderProfiler,
+    _is_nan,
+    _parse_datetime,
 )
 from tests.test_utils import expectationSuiteValidationResultSchema
 
 FALSEY_VALUES = [None, [], False]
 
 
+def test__is_nan():
+    assert _is_nan(float("nan"))
+    assert _is_nan(np.float32("nan"))
+    assert _is_nan(np.float64("nan"))
+    assert not _is_nan(1.5)
+    assert not _is_nan(1)
+    assert not _is_nan(None)
+    assert not _is_nan("nan")
+
+
+def test__parse_datetime():
+    assert _parse_datetime("2020-02-04 22:12:05.943152") == datetime.datetime(
+        2020, 2, 4, 22, 12, 5, 943152
+    )
+    assert _parse_datetime("2020-02-04T22:12:05") == datetime.datetime(
+        2020, 2, 4, 22, 12, 5
+    )
+    assert _parse_datetime("Feb 4 2020 10:12 PM") == datetime.datetime(
+        2020, 2, 4, 22, 12
+    )
+
+
 def test__find_next_low_card_column(
     non_numeric_low_card_dataset, non_numeric_high_card_dataset
 ):
@@ -48,6 +81,91 @@ def test__find_next_low_card_column(
     )
 
 
+def test__prime_column_cache(
+    non_numeric_low_card_dataset, non_numeric_high_card_dataset
+):
+    column_cache = {}
+    BasicSuiteBuilderProfiler._prime_column_cache(
+        non_numeric_low_card_dataset, ["lowcardnonnum"], column_cache
+    )
+    assert column_cache["lowcardnonnum"]["cardinality"] == BasicSuiteBuilderProfiler._get_column_cardinality(
+        non_numeric_low_card_dataset, "lowcardnonnum"
+    )
+    assert column_cache["lowcardnonnum"]["unique_count"] == 2
+
+    column_cache = {}
+    BasicSuiteBuilderProfiler._prime_column_cache(
+        non_numeric_high_card_dataset, ["highcardnonnum"], column_cache
+    )
+    assert column_cache["highcardnonnum"]["cardinality"] == BasicSuiteBuilderProfiler._get_column_cardinality(
+        non_numeric_high_card_dataset, "highcardnonnum"
+    )
+
+
+class _ApproximateCountsDataset(object):
+    """Stands in for a dataset whose backend returns approximate unique counts when allowed to."""
+
+    # column: (approximate unique count, exact unique count, nonnull count)
+    counts = {
+        # the estimate is within the error bounds of every value being unique
+        "almost_unique": (99000, 100000, 100000),
+        # the estimate straddles the 1000 distinct value boundary between FEW and MANY
+        "almost_thousand": (990, 1005, 1000000),
+        # far from any boundary
+        "very_many": (50000, 50321, 100000),
+        "few": (300, 297, 1000000),
+    }
+
+    def __init__(self):
+        self.calls = []
+
+    def get_column_unique_and_nonnull_counts(self, columns, allow_relative_error=False):
+        self.calls.append((list(columns), allow_relative_error))
+        index = 0 if allow_relative_error else 1
+        return {column: (self.counts[column][index], self.counts[column][2]) for column in columns}
+
+
+class _ExactCountsDataset(_ApproximateCountsDataset):
+    def get_column_unique_and_nonnull_counts(self, columns, allow_relative_error=False):
+        if allow_relative_error is not False:
+            self.calls.append((list(columns), allow_relative_error))
+            raise ValueError("allow_relative_error is not supported")
+        return super(_ExactCountsDataset, self).get_column_unique_and_nonnull_counts(columns)
+
+
+def test__get_column_unique_and_nonnull_counts_recounts_ambiguous_columns():
+    dataset = _ApproximateCountsDataset()
+    columns = ["almost_unique", "almost_thousand", "very_many", "few"]
+
+    counts = BasicSuiteBuilderProfiler._get_column_unique_and_nonnull_counts(dataset, columns)
+
+    assert dataset.calls == [
+        (columns, BasicSuiteBuilderProfiler.CARDINALITY_RELATIVE_ERROR),
+        (["almost_unique", "almost_thousand"], False),
+    ]
+    assert counts == {
+        "almost_unique": (100000, 100000),
+        "almost_thousand": (1005, 1000000),
+        "very_many": (50000, 100000),
+        "few": (300, 1000000),
+    }
+    assert BasicSuiteBuilderProfiler._get_cardinality_from_counts(50000, 0.5) == ProfilerCardinality.VERY_MANY
+    assert BasicSuiteBuilderProfiler._get_cardinality_from_counts(300, 0.0003) == ProfilerCardinality.FEW
+
+
+def test__get_column_unique_and_nonnull_counts_falls_back_to_exact_counts():
+    dataset = _ExactCountsDataset()
+    columns = ["almost_unique", "very_many"]
+
+    counts = BasicSuiteBuilderProfiler._get_column_unique_and_nonnull_counts(dataset, columns)
+
+    assert dataset.calls == [
+        (columns, BasicSuiteBuilderProfiler.CARDINALITY_RELATIVE_ERROR),
+        (columns, False),
+    ]
+    assert counts == {"almost_unique": (100000, 100000), "very_many": (50321, 100000)}
+
+
 def test__create_expectations_for_low_card_column(non_numeric_low_card_dataset):
     column = "lowcardnonnum"
     column_cache = {}
@@ -107,6 +225,56 @@ def test__find_next_numeric_column(
     )
 
 
+def test__create_expectations_for_numeric_column_bounds_each_statistic(
+    numeric_high_card_dataset,
+):
+    column = "norm_0_1"
+    observed = {
+        "min": numeric_high_card_dataset.get_column_min(column),
+        "max": numeric_high_card_dataset.get_column_max(column),
+        "mean": numeric_high_card_dataset.get_column_mean(column),
+        "median": numeric_high_card_dataset.get_column_median(column),
+    }
+
+    BasicSuiteBuilderProfiler._create_expectations_for_numeric_column(
+        numeric_high_card_dataset, column
+    )
+    expectation_suite = numeric_high_card_dataset.get_expectation_suite(
+        suppress_warnings=True
+    )
+
+    for stat, observed_value in observed.items():
+        expectations = [
+            expectation
+            for expectation in expectation_suite.expectations
+            if expectation.expectation_type == f"expect_column_{stat}_to_be_between"
+            and expectation.kwargs.get("column") == column
+        ]
+        assert len(expectations) == 1
+        assert expectations[0].kwargs["min_value"] == observed_value - 1
+        assert expectations[0].kwargs["max_value"] == observed_value + 1
+
+
+@pytest.mark.skipif(os.getenv("PANDAS") == "0.22.0", reason="0.22.0 pandas")
+def test__create_expectations_for_numeric_column_skips_nan_statistics_on_pandas():
+    # the mean of -inf and inf is nan, while the other statistics are well defined
+    dataset = ge.dataset.PandasDataset({"x": [-Infinity, 1.0, Infinity]})
+    assert _is_nan(dataset.get_column_mean("x"))
+
+    BasicSuiteBuilderProfiler._create_expectations_for_numeric_column(dataset, "x")
+    expectation_types = [
+        expectation.expectation_type
+        for expectation in dataset.get_expectation_suite(
+            suppress_warnings=True
+        ).expectations
+    ]
+
+    assert "expect_column_mean_to_be_between" not in expectation_types
+    assert expectation_types.count("expect_column_min_to_be_between") == 1
+    assert expectation_types.count("expect_column_max_to_be_between") == 1
+    assert expectation_types.count("expect_column_median_to_be_between") == 1
+
+
 def test__create_expectations_for_numeric_column(
     numeric_high_card_dataset, test_backend
 ):
@@ -563,15 +731,6 @@ def test_BasicSuiteBuilderProfiler_uses_all_columns_if_configuration_does_not_ha
                 "meta": {"BasicSuiteBuilderProfiler": {"confidence": "very low"}},
                 "expectation_type": "expect_column_max_to_be_between",
             },
-            {
-                "kwargs": {
-                    "column": "infinities",
-                    "min_value": None,
-                    "max_value": None,
-                },
-                "meta": {"BasicSuiteBuilderProfiler": {"confidence": "very low"}},
-                "expectation_type": "expect_column_mean_to_be_between",
-            },
             {
                 "kwargs": {"column": "infinities", "min_value": -1.0, "max_value": 1.0},
                 "meta": {"BasicSuiteBuilderProfiler": {"confidence": "very low"}},
@@ -910,6 +1069,94 @@ def test_BasicSuiteBuilderProfiler_respects_included_expectations_on_pandas(
     assert observed_suite == expected
 
 
+@pytest.mark.skipif(os.getenv("PANDAS") == "0.22.0", reason="0.22.0 pandas")
+def test_BasicSuiteBuilderProfiler_keeps_table_order_of_columns_with_excluded_columns_on_pandas(
+    pandas_dataset,
+):
+    observed_suite, evrs = BasicSuiteBuilderProfiler().profile(
+        pandas_dataset, profiler_configuration={"excluded_columns": ["nulls"]}
+    )
+
+    profiled_columns = []
+    for expectation in observed_suite.expectations:
+        column = expectation.kwargs.get("column")
+        if (
+            column is not None
+            and expectation.expectation_type != "expect_column_to_exist"
+            and column not in profiled_columns
+        ):
+            profiled_columns.append(column)
+    assert profiled_columns == ["infinities", "naturals"]
+
+
+@pytest.mark.skipif(os.getenv("PANDAS") == "0.22.0", reason="0.22.0 pandas")
+def test_BasicSuiteBuilderProfiler_parallel_profiling_matches_serial_profiling_on_pandas(
+    pandas_dataset,
+):
+    parallel_dataset = pandas_dataset.copy()
+    serial_suite, _ = BasicSuiteBuilderProfiler().profile(pandas_dataset)
+    parallel_suite, _ = BasicSuiteBuilderProfiler().profile(
+        parallel_dataset, profiler_configuration={"parallel_profiling": True}
+    )
+
+    # remove metadata to simplify assertions
+    serial_suite.meta = None
+    parallel_suite.meta = None
+    assert parallel_suite == serial_suite
+
+
+def test__prefetch_column_metrics_warms_value_counts_cache_keys():
+    dataset = mock.Mock(caching=True, engine=None, has_temporary_table=False)
+    column_cache = {"lowcard": {"cardinality": ProfilerCardinality.VERY_FEW}}
+
+    BasicSuiteBuilderProfiler._prefetch_column_metrics(dataset, ["lowcard"], column_cache)
+
+    # the same arguments, passed the same way, as the expectation builders use
+    assert dataset.get_column_value_counts.call_args_list == [
+        mock.call("lowcard"),
+        mock.call("lowcard", "value"),
+    ]
+
+
+def test__prefetch_column_metrics_skips_datasets_unsafe_to_query_concurrently(
+    sa, tmp_path, caplog
+):
+    caplog.set_level(logging.INFO)
+    column_cache = {"lowcard": {"cardinality": ProfilerCardinality.VERY_FEW}}
+    unsafe_datasets = [
+        mock.Mock(caching=False, engine=None, has_temporary_table=False),
+        mock.Mock(
+            caching=True,
+            engine=sa.create_engine("sqlite://").connect(),
+            has_temporary_table=False,
+        ),
+        mock.Mock(
+            caching=True,
+            engine=sa.create_engine("sqlite:///" + str(tmp_path / "db.sqlite")),
+            has_temporary_table=True,
+        ),
+        mock.Mock(
+            caching=True, engine=sa.create_engine("sqlite://"), has_temporary_table=False
+        ),
+    ]
+    for dataset in unsafe_datasets:
+        caplog.clear()
+        BasicSuiteBuilderProfiler._prefetch_column_metrics(
+            dataset, ["lowcard"], column_cache
+        )
+        dataset.get_column_value_counts.assert_not_called()
+        assert "Profiling columns serially because" in caplog.text
+
+    # a pooled engine without a temporary table can be queried from several threads
+    dataset = mock.Mock(
+        caching=True,
+        engine=sa.create_engine("sqlite:///" + str(tmp_path / "db.sqlite")),
+        has_temporary_table=False,
+    )
+    BasicSuiteBuilderProfiler._prefetch_column_metrics(dataset, ["lowcard"], column_cache)
+    assert dataset.get_column_value_counts.call_count == 2
+
+
 @pytest.mark.skipif(os.getenv("PANDAS") == "0.22.0", reason="0.22.0 pandas")
 @pytest.mark.parametrize("included_columns", FALSEY_VALUES)
 def test_BasicSuiteBuilderProfiler_uses_no_columns_if_included_columns_are_falsey_on_pandas(
@@ -1037,15 +1284,6 @@ def test_BasicSuiteBuilderProfiler_uses_all_expectations_if_excluded_expectation
                 "expectation_type": "expect_column_max_to_be_between",
                 "meta": {"BasicSuiteBuilderProfiler": {"confidence": "very low"}},
             },
-            {
-                "kwargs": {
-                    "column": "infinities",
-                    "min_value": None,
-                    "max_value": None,
-                },
-                "expectation_type": "expect_column_mean_to_be_between",
-                "meta": {"BasicSuiteBuilderProfiler": {"confidence": "very low"}},
-            },
             {
                 "kwargs": {"column": "infinities", "min_value": -1.0, "max_value": 1.0},
                 "expectation_type": "expect_column_median_to_be_between",